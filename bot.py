@@ -3,23 +3,85 @@ Binance Futures Trading Bot - Main Bot Class
 Supports Market, Limit, Stop-Limit, and OCO orders on Binance Futures Testnet (USDT-M).
 """
 
+import requests.adapters
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceOrderException
+from collections import namedtuple
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from decimal import Decimal, ROUND_DOWN
+from decimal import Decimal
+from pathlib import Path
+import asyncio
+import functools
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import math
+import pickle
+import socket
+import threading
 import time
 
 from config import BotConfig
 from logger import BotLogger, get_logger
 
 
+# Connection pool sizing and keep-alive tuning for the REST session.
+# Binance closes idle connections after ~90s, so we ping every 60s to keep
+# the pooled TLS connections warm and avoid per-order handshake latency.
+POOL_SIZE = 32
+KEEPALIVE_INTERVAL = 60.0
+
+# Exchange info (symbol filters, precision rules) changes rarely — typically
+# days or weeks apart — so cache it aggressively and persist across restarts.
+SYMBOL_INFO_TTL = 24 * 3600
+# One cache file per environment - testnet filters differ from mainnet
+SYMBOL_CACHE_DIR = Path.home() / ".cache"
+
+# WebSocket trade API endpoints - a persistent authenticated connection
+# avoids the per-order HTTP handshake/parse overhead of REST
+WS_TRADE_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+WS_TRADE_TESTNET_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+
+# Transient errors where the order may or may not have reached the matching
+# engine; safe to resend with the same newClientOrderId and let Binance dedupe
+RETRYABLE_ERROR_CODES = {-1001, -1007}
+
+
 class OrderSide(Enum):
     """Order side enumeration."""
     BUY = "BUY"
     SELL = "SELL"
 
 
+# Hot-path side lookup: a dict hit is cheaper than the Enum.value
+# descriptor dispatch repeated across params dicts and log sites
+_SIDE = {OrderSide.BUY: "BUY", OrderSide.SELL: "SELL"}
+
+# One rung of a batch limit-order ladder (see place_limit_orders_batch)
+LimitOrderSpec = namedtuple("LimitOrderSpec", "side qty price")
+
+
 class OrderType(Enum):
     """Order type enumeration."""
     MARKET = "MARKET"
@@ -30,11 +92,148 @@ class OrderType(Enum):
     TAKE_PROFIT_LIMIT = "TAKE_PROFIT"
 
 
-class PositionSide(Enum):
-    """Position side for hedge mode."""
-    BOTH = "BOTH"
-    LONG = "LONG"
-    SHORT = "SHORT"
+def _install_orjson_decoder(session) -> None:
+    """
+    Route response JSON decoding through orjson on a requests session.
+
+    python-binance parses every payload via Response.json(); large responses
+    like exchangeInfo decode 2-3x faster with orjson. No-op without orjson.
+    """
+    original_send = session.send
+
+    def send_with_orjson(request, **kwargs):
+        response = original_send(request, **kwargs)
+        response.json = lambda **kw: orjson.loads(response.content)
+        return response
+
+    session.send = send_with_orjson
+
+
+def _precision_of(size: Decimal) -> int:
+    """Number of decimal places in a step/tick size like Decimal('0.001')."""
+    return max(0, -size.normalize().as_tuple().exponent)
+
+
+def _pow10_scale(size: Decimal) -> Optional[int]:
+    """
+    Integer 1/size when size is a power of ten (0.001 -> 1000), else None.
+
+    Lets validation round with plain float math instead of Decimal.
+    """
+    if size <= 0:
+        return None
+    digits, exponent = Decimal(size).normalize().as_tuple()[1:]
+    if digits == (1,) and exponent <= 0:
+        return 10 ** -exponent
+    return None
+
+
+def _snap_scaled(scaled: float) -> float:
+    """
+    Snap a scaled value onto the integer grid when it is only float
+    noise away (1.001 * 1000 -> 1000.9999... -> 1001.0), so aligned
+    inputs are not knocked down a whole step by flooring.
+
+    The tolerance is relative because float error grows with magnitude;
+    a fixed epsilon would stop matching above ~1e7.
+    """
+    nearest = round(scaled)
+    if math.isclose(scaled, nearest, rel_tol=1e-12, abs_tol=1e-9):
+        return float(nearest)
+    return scaled
+
+
+@dataclass(slots=True)
+class SymbolRules:
+    """Pre-parsed LOT_SIZE / PRICE_FILTER constraints for one symbol."""
+    min_qty: Decimal
+    max_qty: Decimal
+    step_size: Decimal
+    qty_precision: int
+    min_price: Decimal
+    max_price: Decimal
+    tick_size: Decimal
+    price_precision: int
+    # Integer 1/step and 1/tick for power-of-10 sizes; None otherwise
+    step_scaled: Optional[int] = None
+    tick_scaled: Optional[int] = None
+
+    @classmethod
+    def from_symbol_info(cls, symbol_info: Dict[str, Any]) -> "SymbolRules":
+        """Build rules from a raw exchange info entry in a single filter pass."""
+        min_qty = min_price = Decimal(0)
+        max_qty = max_price = Decimal("Infinity")
+        step_size = tick_size = Decimal(0)
+        qty_precision = price_precision = 0
+
+        for filter_item in symbol_info["filters"]:
+            filter_type = filter_item["filterType"]
+            if filter_type == "LOT_SIZE":
+                min_qty = Decimal(filter_item["minQty"])
+                max_qty = Decimal(filter_item["maxQty"])
+                step_size = Decimal(filter_item["stepSize"])
+                qty_precision = _precision_of(step_size)
+            elif filter_type == "PRICE_FILTER":
+                min_price = Decimal(filter_item["minPrice"])
+                max_price = Decimal(filter_item["maxPrice"])
+                tick_size = Decimal(filter_item["tickSize"])
+                price_precision = _precision_of(tick_size)
+
+        return cls(
+            min_qty=min_qty,
+            max_qty=max_qty,
+            step_size=step_size,
+            qty_precision=qty_precision,
+            min_price=min_price,
+            max_price=max_price,
+            tick_size=tick_size,
+            price_precision=price_precision,
+            step_scaled=_pow10_scale(step_size),
+            tick_scaled=_pow10_scale(tick_size)
+        )
+
+
+@dataclass(slots=True)
+class OrderResponse:
+    """Typed order response; slotted to avoid per-order dict allocation."""
+    order_id: Optional[int]
+    client_order_id: Optional[str]
+    symbol: Optional[str]
+    side: Optional[str]
+    type: Optional[str]
+    status: Optional[str]
+    price: float
+    quantity: float
+    executed_qty: float
+    avg_price: float
+    stop_price: Optional[float]
+    time_in_force: Optional[str]
+    reduce_only: bool
+    close_position: bool
+    working_type: Optional[str]
+    update_time: Optional[int]
+
+    @classmethod
+    def from_raw(cls, order: Dict[str, Any]) -> "OrderResponse":
+        """Parse a raw API order payload into typed fields."""
+        return cls(
+            order_id=order.get("orderId"),
+            client_order_id=order.get("clientOrderId"),
+            symbol=order.get("symbol"),
+            side=order.get("side"),
+            type=order.get("type"),
+            status=order.get("status"),
+            price=float(order.get("price", 0)),
+            quantity=float(order.get("origQty", 0)),
+            executed_qty=float(order.get("executedQty", 0)),
+            avg_price=float(order.get("avgPrice", 0)),
+            stop_price=float(order.get("stopPrice", 0)) if order.get("stopPrice") else None,
+            time_in_force=order.get("timeInForce"),
+            reduce_only=order.get("reduceOnly", False),
+            close_position=order.get("closePosition", False),
+            working_type=order.get("workingType"),
+            update_time=order.get("updateTime")
+        )
 
 
 class BasicBot:
@@ -55,54 +254,145 @@ class BasicBot:
         api_secret: str,
         testnet: bool = True,
         config: Optional[BotConfig] = None,
-        logger: Optional[BotLogger] = None
+        logger: Optional[BotLogger] = None,
+        keepalive: bool = True
     ):
         """
         Initialize the trading bot.
-        
+
         Args:
             api_key: Binance API key
             api_secret: Binance API secret
             testnet: Whether to use testnet (default: True)
             config: Optional BotConfig instance
             logger: Optional BotLogger instance
+            keepalive: Whether to run the background keep-alive ping (default: True)
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
         self.config = config or BotConfig()
         self.logger = logger or get_logger()
-        
+
+        # Background keep-alive ping (disable in tests)
+        self._keepalive_enabled = keepalive
+        self._keepalive_timer: Optional[threading.Timer] = None
+
+        # First real API ping happens lazily (see _ensure_connected)
+        self._connected = False
+        self._connect_lock = threading.Lock()
+
         # Initialize Binance client
         self.client = self._initialize_client()
-        
-        # Cache for symbol info
-        self._symbol_info_cache: Dict[str, Dict] = {}
-        
+
+        # Cache for symbol info: symbol -> (expiry timestamp, info dict)
+        env = "testnet" if testnet else "mainnet"
+        self._symbol_cache_file = SYMBOL_CACHE_DIR / f"bot_symbols_{env}.pkl"
+        self._symbol_info_cache: Dict[str, Tuple[float, Dict]] = self._load_symbol_cache()
+
+        # Pre-parsed trading rules derived from symbol info
+        self._rules_cache: Dict[str, SymbolRules] = {}
+
+        # Executor backing the *_async order methods
+        self._executor = ThreadPoolExecutor(max_workers=16)
+
+        # Monotonic client-order-id source for idempotent retries
+        self._coid_counter = itertools.count(int(time.time() * 1000))
+
+        # Lazily-opened WebSocket trade connection (see place_order_ws)
+        self._ws_trade = None
+        self._ws_request_ids = itertools.count(1)
+        self._ws_lock = threading.Lock()
+
+        if self._keepalive_enabled:
+            self._schedule_keepalive()
+
+        # Warm the TLS session in the background so the first user-initiated
+        # order does not pay the handshake; __init__ returns immediately
+        threading.Thread(target=self._prewarm_connection, daemon=True).start()
+
         self.logger.info(f"Trading Bot initialized - Testnet: {testnet}")
     
     def _initialize_client(self) -> Client:
         """Initialize and configure the Binance client."""
         try:
             client = Client(self.api_key, self.api_secret)
-            
+
             if self.testnet:
                 # Set testnet URLs for futures
                 client.FUTURES_URL = "https://testnet.binancefuture.com/fapi"
                 self.logger.info("Connected to Binance Futures Testnet")
-            
-            self.logger.log_api_request("GET", "/fapi/v1/ping")
-            client.futures_ping()
-            self.logger.log_api_response("SUCCESS", {"status": "connected"})
-            
+
+            # Reuse pooled TLS connections instead of paying a fresh
+            # TCP+TLS handshake on every order
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=POOL_SIZE,
+                pool_maxsize=POOL_SIZE,
+                max_retries=0
+            )
+            client.session.mount("https://", adapter)
+            client.session.headers.update({
+                "Connection": "keep-alive",
+                "Keep-Alive": "timeout=90, max=1000"
+            })
+
+            if orjson is not None:
+                _install_orjson_decoder(client.session)
+
+            # Cheap TCP-only reachability probe: no TLS handshake, no HTTP
+            # round trip, so constructing many bots does not serialize on
+            # full pings. The real ping happens lazily in _ensure_connected.
+            host = "testnet.binancefuture.com" if self.testnet else "fapi.binance.com"
+            socket.create_connection((host, 443), timeout=2.0).close()
+            self.logger.info(f"Network reachability confirmed: {host}")
+
             return client
-            
+
         except Exception as e:
             self.logger.log_api_error("CONNECTION", str(e))
             raise ConnectionError(f"Failed to connect to Binance: {e}")
-    
+
+    def _ensure_connected(self):
+        """Verify API connectivity with a one-time ping on first use."""
+        if self._connected:
+            return
+        with self._connect_lock:
+            if self._connected:
+                return
+            self.logger.log_api_request("GET", "/fapi/v1/ping")
+            self.client.futures_ping()
+            self.logger.log_api_response("SUCCESS", {"status": "connected"})
+            self._connected = True
+
+    def _prewarm_connection(self):
+        """Establish the first TLS connection off the constructor path."""
+        try:
+            self._ensure_connected()
+        except Exception as e:
+            # First real API call will retry and surface the error properly
+            self.logger.warning(f"Connection prewarm failed: {e}")
+
+    def _schedule_keepalive(self):
+        """Schedule the next background keep-alive ping."""
+        if not self._keepalive_enabled:
+            return
+        timer = threading.Timer(KEEPALIVE_INTERVAL, self._keepalive_ping)
+        timer.daemon = True
+        timer.start()
+        self._keepalive_timer = timer
+
+    def _keepalive_ping(self):
+        """Ping the exchange to keep pooled connections warm."""
+        try:
+            self.client.futures_ping()
+        except Exception as e:
+            self.logger.warning(f"Keep-alive ping failed: {e}")
+        self._schedule_keepalive()
+
     def get_account_info(self) -> Dict[str, Any]:
         """Get futures account information."""
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("GET", "/fapi/v2/account")
             account = self.client.futures_account()
@@ -122,6 +412,8 @@ class BasicBot:
         Returns:
             Dictionary with balance information
         """
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("GET", "/fapi/v2/balance")
             balances = self.client.futures_account_balance()
@@ -153,23 +445,103 @@ class BasicBot:
         Returns:
             Symbol information dictionary
         """
-        if symbol in self._symbol_info_cache:
-            return self._symbol_info_cache[symbol]
-        
+        cached = self._symbol_info_cache.get(symbol)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
+        self.logger.log_api_request("GET", "/fapi/v1/exchangeInfo")
+
+        # Cold path: stream-parse just the target symbol instead of
+        # materializing the full multi-MB payload as Python objects
+        if ijson is not None:
+            try:
+                info = self._fetch_symbol_info_streaming(symbol)
+            except Exception as e:
+                self.logger.warning(f"Streaming exchange info fetch failed: {e}")
+            else:
+                if info is None:
+                    raise ValueError(f"Symbol {symbol} not found")
+                self._symbol_info_cache[symbol] = (time.time() + SYMBOL_INFO_TTL, info)
+                self._rules_cache.pop(symbol, None)
+                self._save_symbol_cache()
+                return info
+
         try:
-            self.logger.log_api_request("GET", "/fapi/v1/exchangeInfo")
             exchange_info = self.client.futures_exchange_info()
-            
+
+            # One heavy download serves every symbol for the TTL window
+            expiry = time.time() + SYMBOL_INFO_TTL
             for s in exchange_info["symbols"]:
-                if s["symbol"] == symbol:
-                    self._symbol_info_cache[symbol] = s
-                    return s
-            
+                self._symbol_info_cache[s["symbol"]] = (expiry, s)
+            self._save_symbol_cache()
+            self._rules_cache.clear()
+
+            cached = self._symbol_info_cache.get(symbol)
+            if cached is not None:
+                return cached[1]
+
             raise ValueError(f"Symbol {symbol} not found")
-            
+
         except BinanceAPIException as e:
             self.logger.log_api_error(str(e.code), e.message)
             raise
+
+    def _fetch_symbol_info_streaming(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Stream-parse exchange info for a single symbol with ijson.
+
+        Only the target symbol's subtree is built as Python objects; the
+        response is abandoned as soon as it is found.
+        """
+        response = self.client.session.get(
+            self.client.FUTURES_URL + "/v1/exchangeInfo",
+            stream=True,
+            timeout=30
+        )
+        response.raise_for_status()
+        response.raw.decode_content = True
+        try:
+            for s in ijson.items(response.raw, "symbols.item"):
+                if s["symbol"] == symbol:
+                    return s
+            return None
+        finally:
+            response.close()
+
+    def _load_symbol_cache(self) -> Dict[str, Tuple[float, Dict]]:
+        """Load the persisted symbol info cache, if present and readable."""
+        try:
+            with open(self._symbol_cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # A corrupted pickle can raise almost anything; a stale or
+            # unreadable cache just means a cold fetch
+            return {}
+
+    def _save_symbol_cache(self):
+        """Persist the symbol info cache so restarts skip the cold fetch."""
+        try:
+            self._symbol_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._symbol_cache_file, "wb") as f:
+                pickle.dump(self._symbol_info_cache, f)
+        except OSError as e:
+            self.logger.warning(f"Could not persist symbol cache: {e}")
+
+    def _get_symbol_rules(self, symbol: str) -> SymbolRules:
+        """
+        Get pre-parsed trading rules for a symbol.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            SymbolRules with parsed filter constraints
+        """
+        rules = self._rules_cache.get(symbol)
+        if rules is None:
+            rules = SymbolRules.from_symbol_info(self.get_symbol_info(symbol))
+            self._rules_cache[symbol] = rules
+        return rules
     
     def get_current_price(self, symbol: str) -> float:
         """
@@ -181,6 +553,8 @@ class BasicBot:
         Returns:
             Current price as float
         """
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("GET", f"/fapi/v1/ticker/price?symbol={symbol}")
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
@@ -203,33 +577,42 @@ class BasicBot:
             Tuple of (is_valid, message, adjusted_quantity)
         """
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            
-            for filter_item in symbol_info["filters"]:
-                if filter_item["filterType"] == "LOT_SIZE":
-                    min_qty = float(filter_item["minQty"])
-                    max_qty = float(filter_item["maxQty"])
-                    step_size = float(filter_item["stepSize"])
-                    
-                    if quantity < min_qty:
-                        return False, f"Quantity {quantity} below minimum {min_qty}", quantity
-                    
-                    if quantity > max_qty:
-                        return False, f"Quantity {quantity} above maximum {max_qty}", quantity
-                    
-                    # Adjust to step size
-                    precision = len(str(step_size).rstrip('0').split('.')[-1]) if '.' in str(step_size) else 0
-                    adjusted_qty = float(Decimal(str(quantity)).quantize(
-                        Decimal(str(step_size)), rounding=ROUND_DOWN
-                    ))
-                    
-                    return True, "Valid", adjusted_qty
-            
-            return True, "No LOT_SIZE filter found", quantity
-            
+            rules = self._get_symbol_rules(symbol)
+            return self._check_quantity(rules, quantity)
         except Exception as e:
             self.logger.warning(f"Could not validate quantity: {e}")
             return True, "Validation skipped", quantity
+
+    @staticmethod
+    def _check_quantity(rules: SymbolRules, quantity: float) -> Tuple[bool, str, float]:
+        """Check a quantity against pre-parsed rules."""
+        # Fast path: input already sits on the step grid and inside bounds,
+        # common when strategies feed pre-quantized values
+        if rules.step_scaled is not None:
+            q_scaled = _snap_scaled(quantity * rules.step_scaled)
+            if q_scaled == int(q_scaled) and rules.min_qty <= quantity <= rules.max_qty:
+                return True, "Valid", quantity
+
+        if quantity < rules.min_qty:
+            return False, f"Quantity {quantity} below minimum {rules.min_qty}", quantity
+
+        if quantity > rules.max_qty:
+            return False, f"Quantity {quantity} above maximum {rules.max_qty}", quantity
+
+        # Adjust to step size - pure float math for power-of-10 steps,
+        # Decimal quantize as the fallback for irregular ones
+        if rules.step_scaled is not None:
+            adjusted_qty = math.floor(_snap_scaled(quantity * rules.step_scaled)) / rules.step_scaled
+        elif rules.step_size > 0:
+            # Align to the step itself; quantizing against the raw size
+            # only matches its decimal places, not the grid
+            adjusted_qty = float(
+                (Decimal(str(quantity)) // rules.step_size) * rules.step_size
+            )
+        else:
+            adjusted_qty = quantity
+
+        return True, "Valid", adjusted_qty
     
     def _validate_price(self, symbol: str, price: float) -> Tuple[bool, str, float]:
         """
@@ -243,94 +626,176 @@ class BasicBot:
             Tuple of (is_valid, message, adjusted_price)
         """
         try:
-            symbol_info = self.get_symbol_info(symbol)
-            
-            for filter_item in symbol_info["filters"]:
-                if filter_item["filterType"] == "PRICE_FILTER":
-                    min_price = float(filter_item["minPrice"])
-                    max_price = float(filter_item["maxPrice"])
-                    tick_size = float(filter_item["tickSize"])
-                    
-                    if price < min_price:
-                        return False, f"Price {price} below minimum {min_price}", price
-                    
-                    if max_price > 0 and price > max_price:
-                        return False, f"Price {price} above maximum {max_price}", price
-                    
-                    # Adjust to tick size
-                    precision = len(str(tick_size).rstrip('0').split('.')[-1]) if '.' in str(tick_size) else 0
-                    adjusted_price = float(Decimal(str(price)).quantize(
-                        Decimal(str(tick_size)), rounding=ROUND_DOWN
-                    ))
-                    
-                    return True, "Valid", adjusted_price
-            
-            return True, "No PRICE_FILTER found", price
-            
+            rules = self._get_symbol_rules(symbol)
+            return self._check_price(rules, price)
         except Exception as e:
             self.logger.warning(f"Could not validate price: {e}")
             return True, "Validation skipped", price
-    
-    def place_market_order(
+
+    @staticmethod
+    def _check_price(rules: SymbolRules, price: float) -> Tuple[bool, str, float]:
+        """Check a price against pre-parsed rules."""
+        # Fast path: price already aligned to the tick grid and inside bounds
+        if rules.tick_scaled is not None:
+            p_scaled = _snap_scaled(price * rules.tick_scaled)
+            if p_scaled == int(p_scaled) and rules.min_price <= price <= rules.max_price:
+                return True, "Valid", price
+
+        if price < rules.min_price:
+            return False, f"Price {price} below minimum {rules.min_price}", price
+
+        if rules.max_price > 0 and price > rules.max_price:
+            return False, f"Price {price} above maximum {rules.max_price}", price
+
+        # Adjust to tick size - same float fast path as quantities
+        if rules.tick_scaled is not None:
+            adjusted_price = math.floor(_snap_scaled(price * rules.tick_scaled)) / rules.tick_scaled
+        elif rules.tick_size > 0:
+            adjusted_price = float(
+                (Decimal(str(price)) // rules.tick_size) * rules.tick_size
+            )
+        else:
+            adjusted_price = price
+
+        return True, "Valid", adjusted_price
+
+    def _validate_order(
         self,
         symbol: str,
-        side: OrderSide,
-        quantity: float,
-        reduce_only: bool = False
-    ) -> Dict[str, Any]:
+        *,
+        quantity: Optional[float] = None,
+        price: Optional[float] = None,
+        stop_price: Optional[float] = None
+    ) -> Dict[str, float]:
         """
-        Place a market order.
-        
+        Validate and adjust all supplied order fields with one rules lookup.
+
         Args:
-            symbol: Trading pair symbol (e.g., BTCUSDT)
-            side: Order side (BUY or SELL)
-            quantity: Order quantity
-            reduce_only: Whether this is a reduce-only order
-            
+            symbol: Trading pair symbol
+            quantity: Order quantity to validate, if any
+            price: Limit price to validate, if any
+            stop_price: Stop/trigger price to validate, if any
+
+        Returns:
+            Dictionary of adjusted values for the supplied fields
+
+        Raises:
+            ValueError: If any supplied field fails validation
+        """
+        try:
+            rules = self._get_symbol_rules(symbol)
+        except Exception as e:
+            self.logger.warning(f"Could not validate order: {e}")
+            adjusted = {"quantity": quantity, "price": price, "stop_price": stop_price}
+            return {k: v for k, v in adjusted.items() if v is not None}
+
+        adjusted = {}
+
+        if quantity is not None:
+            is_valid, msg, adjusted["quantity"] = self._check_quantity(rules, quantity)
+            if not is_valid:
+                self.logger.error(f"Invalid quantity: {msg}")
+                raise ValueError(msg)
+
+        if price is not None:
+            is_valid, msg, adjusted["price"] = self._check_price(rules, price)
+            if not is_valid:
+                self.logger.error(f"Invalid price: {msg}")
+                raise ValueError(msg)
+
+        if stop_price is not None:
+            is_valid, msg, adjusted["stop_price"] = self._check_price(rules, stop_price)
+            if not is_valid:
+                self.logger.error(f"Invalid stop price: {msg}")
+                raise ValueError(msg)
+
+        return adjusted
+    
+    def _submit_order(self, params: Dict[str, Any]) -> OrderResponse:
+        """
+        Submit an order to the exchange and format the result.
+
+        Shared by all place_*_order methods: handles request logging, the
+        API call, error logging, and result logging in one place.
+
+        Args:
+            params: Fully validated order parameters
+
         Returns:
             Order result dictionary
         """
-        # Validate quantity
-        is_valid, msg, adjusted_qty = self._validate_quantity(symbol, quantity)
-        if not is_valid:
-            self.logger.error(f"Invalid quantity: {msg}")
-            raise ValueError(msg)
-        
-        self.logger.log_order("MARKET", side.value, symbol, adjusted_qty)
-        
+        self._ensure_connected()
+
+        # A client-generated id makes retries idempotent: if a transient
+        # error hides whether the first attempt landed, resending with the
+        # same id is safe and needs no status probe
+        params.setdefault("newClientOrderId", self._next_client_id())
+
         try:
-            self.logger.log_api_request("POST", "/fapi/v1/order", {
-                "symbol": symbol,
-                "side": side.value,
-                "type": "MARKET",
-                "quantity": adjusted_qty,
-                "reduceOnly": reduce_only
-            })
-            
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side.value,
-                type="MARKET",
-                quantity=adjusted_qty,
-                reduceOnly=reduce_only
-            )
-            
+            # Only log the params dict if it will be emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.log_api_request("POST", "/fapi/v1/order", params)
+
+            try:
+                order = self.client.futures_create_order(**params)
+            except BinanceAPIException as e:
+                if e.code not in RETRYABLE_ERROR_CODES:
+                    raise
+                self.logger.warning(
+                    f"Transient error {e.code}, retrying order "
+                    f"{params['newClientOrderId']}: {e.message}"
+                )
+                order = self.client.futures_create_order(**params)
+
             self.logger.log_order_result(
                 order_id=str(order["orderId"]),
                 status=order["status"],
                 filled_qty=float(order.get("executedQty", 0)),
                 avg_price=float(order.get("avgPrice", 0))
             )
-            
+
             return self._format_order_response(order)
-            
-        except BinanceAPIException as e:
-            self.logger.log_api_error(str(e.code), e.message)
-            raise
-        except BinanceOrderException as e:
+
+        except (BinanceAPIException, BinanceOrderException) as e:
             self.logger.log_api_error(str(e.code), e.message)
             raise
-    
+
+    def _next_client_id(self) -> str:
+        """Generate a unique client order id for this bot instance."""
+        return f"bot-{next(self._coid_counter):x}"
+
+    def place_market_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        quantity: float,
+        reduce_only: bool = False
+    ) -> OrderResponse:
+        """
+        Place a market order.
+
+        Args:
+            symbol: Trading pair symbol (e.g., BTCUSDT)
+            side: Order side (BUY or SELL)
+            quantity: Order quantity
+            reduce_only: Whether this is a reduce-only order
+
+        Returns:
+            Order result dictionary
+        """
+        adjusted = self._validate_order(symbol, quantity=quantity)
+        adjusted_qty = adjusted["quantity"]
+
+        self.logger.log_order("MARKET", _SIDE[side], symbol, adjusted_qty)
+
+        return self._submit_order({
+            "symbol": symbol,
+            "side": _SIDE[side],
+            "type": "MARKET",
+            "quantity": adjusted_qty,
+            "reduceOnly": reduce_only
+        })
+
     def place_limit_order(
         self,
         symbol: str,
@@ -339,7 +804,7 @@ class BasicBot:
         price: float,
         time_in_force: str = "GTC",
         reduce_only: bool = False
-    ) -> Dict[str, Any]:
+    ) -> OrderResponse:
         """
         Place a limit order.
         
@@ -354,56 +819,22 @@ class BasicBot:
         Returns:
             Order result dictionary
         """
-        # Validate quantity and price
-        is_valid, msg, adjusted_qty = self._validate_quantity(symbol, quantity)
-        if not is_valid:
-            self.logger.error(f"Invalid quantity: {msg}")
-            raise ValueError(msg)
-        
-        is_valid, msg, adjusted_price = self._validate_price(symbol, price)
-        if not is_valid:
-            self.logger.error(f"Invalid price: {msg}")
-            raise ValueError(msg)
-        
-        self.logger.log_order("LIMIT", side.value, symbol, adjusted_qty, adjusted_price)
-        
-        try:
-            self.logger.log_api_request("POST", "/fapi/v1/order", {
-                "symbol": symbol,
-                "side": side.value,
-                "type": "LIMIT",
-                "quantity": adjusted_qty,
-                "price": adjusted_price,
-                "timeInForce": time_in_force,
-                "reduceOnly": reduce_only
-            })
-            
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side.value,
-                type="LIMIT",
-                quantity=adjusted_qty,
-                price=adjusted_price,
-                timeInForce=time_in_force,
-                reduceOnly=reduce_only
-            )
-            
-            self.logger.log_order_result(
-                order_id=str(order["orderId"]),
-                status=order["status"],
-                filled_qty=float(order.get("executedQty", 0)),
-                avg_price=float(order.get("avgPrice", 0))
-            )
-            
-            return self._format_order_response(order)
-            
-        except BinanceAPIException as e:
-            self.logger.log_api_error(str(e.code), e.message)
-            raise
-        except BinanceOrderException as e:
-            self.logger.log_api_error(str(e.code), e.message)
-            raise
-    
+        adjusted = self._validate_order(symbol, quantity=quantity, price=price)
+        adjusted_qty = adjusted["quantity"]
+        adjusted_price = adjusted["price"]
+
+        self.logger.log_order("LIMIT", _SIDE[side], symbol, adjusted_qty, adjusted_price)
+
+        return self._submit_order({
+            "symbol": symbol,
+            "side": _SIDE[side],
+            "type": "LIMIT",
+            "quantity": adjusted_qty,
+            "price": adjusted_price,
+            "timeInForce": time_in_force,
+            "reduceOnly": reduce_only
+        })
+
     def place_stop_limit_order(
         self,
         symbol: str,
@@ -413,7 +844,7 @@ class BasicBot:
         stop_price: float,
         time_in_force: str = "GTC",
         reduce_only: bool = False
-    ) -> Dict[str, Any]:
+    ) -> OrderResponse:
         """
         Place a stop-limit order.
         
@@ -429,58 +860,25 @@ class BasicBot:
         Returns:
             Order result dictionary
         """
-        # Validate inputs
-        is_valid, msg, adjusted_qty = self._validate_quantity(symbol, quantity)
-        if not is_valid:
-            raise ValueError(msg)
-        
-        is_valid, msg, adjusted_price = self._validate_price(symbol, price)
-        if not is_valid:
-            raise ValueError(msg)
-        
-        is_valid, msg, adjusted_stop = self._validate_price(symbol, stop_price)
-        if not is_valid:
-            raise ValueError(msg)
-        
-        self.logger.log_order("STOP_LIMIT", side.value, symbol, adjusted_qty, adjusted_price)
+        adjusted = self._validate_order(symbol, quantity=quantity, price=price, stop_price=stop_price)
+        adjusted_qty = adjusted["quantity"]
+        adjusted_price = adjusted["price"]
+        adjusted_stop = adjusted["stop_price"]
+
+        self.logger.log_order("STOP_LIMIT", _SIDE[side], symbol, adjusted_qty, adjusted_price)
         self.logger.info(f"Stop Price: {adjusted_stop}")
-        
-        try:
-            self.logger.log_api_request("POST", "/fapi/v1/order", {
-                "symbol": symbol,
-                "side": side.value,
-                "type": "STOP",
-                "quantity": adjusted_qty,
-                "price": adjusted_price,
-                "stopPrice": adjusted_stop,
-                "timeInForce": time_in_force,
-                "reduceOnly": reduce_only
-            })
-            
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side.value,
-                type="STOP",
-                quantity=adjusted_qty,
-                price=adjusted_price,
-                stopPrice=adjusted_stop,
-                timeInForce=time_in_force,
-                reduceOnly=reduce_only
-            )
-            
-            self.logger.log_order_result(
-                order_id=str(order["orderId"]),
-                status=order["status"],
-                filled_qty=float(order.get("executedQty", 0)),
-                avg_price=float(order.get("avgPrice", 0))
-            )
-            
-            return self._format_order_response(order)
-            
-        except BinanceAPIException as e:
-            self.logger.log_api_error(str(e.code), e.message)
-            raise
-    
+
+        return self._submit_order({
+            "symbol": symbol,
+            "side": _SIDE[side],
+            "type": "STOP",
+            "quantity": adjusted_qty,
+            "price": adjusted_price,
+            "stopPrice": adjusted_stop,
+            "timeInForce": time_in_force,
+            "reduceOnly": reduce_only
+        })
+
     def place_stop_market_order(
         self,
         symbol: str,
@@ -488,7 +886,7 @@ class BasicBot:
         quantity: float,
         stop_price: float,
         reduce_only: bool = False
-    ) -> Dict[str, Any]:
+    ) -> OrderResponse:
         """
         Place a stop-market order.
         
@@ -502,49 +900,22 @@ class BasicBot:
         Returns:
             Order result dictionary
         """
-        is_valid, msg, adjusted_qty = self._validate_quantity(symbol, quantity)
-        if not is_valid:
-            raise ValueError(msg)
-        
-        is_valid, msg, adjusted_stop = self._validate_price(symbol, stop_price)
-        if not is_valid:
-            raise ValueError(msg)
-        
-        self.logger.log_order("STOP_MARKET", side.value, symbol, adjusted_qty)
+        adjusted = self._validate_order(symbol, quantity=quantity, stop_price=stop_price)
+        adjusted_qty = adjusted["quantity"]
+        adjusted_stop = adjusted["stop_price"]
+
+        self.logger.log_order("STOP_MARKET", _SIDE[side], symbol, adjusted_qty)
         self.logger.info(f"Stop Price: {adjusted_stop}")
-        
-        try:
-            self.logger.log_api_request("POST", "/fapi/v1/order", {
-                "symbol": symbol,
-                "side": side.value,
-                "type": "STOP_MARKET",
-                "quantity": adjusted_qty,
-                "stopPrice": adjusted_stop,
-                "reduceOnly": reduce_only
-            })
-            
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side.value,
-                type="STOP_MARKET",
-                quantity=adjusted_qty,
-                stopPrice=adjusted_stop,
-                reduceOnly=reduce_only
-            )
-            
-            self.logger.log_order_result(
-                order_id=str(order["orderId"]),
-                status=order["status"],
-                filled_qty=float(order.get("executedQty", 0)),
-                avg_price=float(order.get("avgPrice", 0))
-            )
-            
-            return self._format_order_response(order)
-            
-        except BinanceAPIException as e:
-            self.logger.log_api_error(str(e.code), e.message)
-            raise
-    
+
+        return self._submit_order({
+            "symbol": symbol,
+            "side": _SIDE[side],
+            "type": "STOP_MARKET",
+            "quantity": adjusted_qty,
+            "stopPrice": adjusted_stop,
+            "reduceOnly": reduce_only
+        })
+
     def place_take_profit_order(
         self,
         symbol: str,
@@ -553,7 +924,7 @@ class BasicBot:
         stop_price: float,
         price: Optional[float] = None,
         reduce_only: bool = True
-    ) -> Dict[str, Any]:
+    ) -> OrderResponse:
         """
         Place a take-profit order (market or limit).
         
@@ -568,54 +939,217 @@ class BasicBot:
         Returns:
             Order result dictionary
         """
-        is_valid, msg, adjusted_qty = self._validate_quantity(symbol, quantity)
-        if not is_valid:
-            raise ValueError(msg)
-        
-        is_valid, msg, adjusted_stop = self._validate_price(symbol, stop_price)
-        if not is_valid:
-            raise ValueError(msg)
-        
+        adjusted = self._validate_order(symbol, quantity=quantity, price=price or None, stop_price=stop_price)
+        adjusted_qty = adjusted["quantity"]
+        adjusted_stop = adjusted["stop_price"]
+
         order_type = "TAKE_PROFIT_MARKET"
         params = {
             "symbol": symbol,
-            "side": side.value,
+            "side": _SIDE[side],
             "type": order_type,
             "quantity": adjusted_qty,
             "stopPrice": adjusted_stop,
             "reduceOnly": reduce_only
         }
-        
+
         if price:
             order_type = "TAKE_PROFIT"
-            is_valid, msg, adjusted_price = self._validate_price(symbol, price)
-            if not is_valid:
-                raise ValueError(msg)
             params["type"] = order_type
-            params["price"] = adjusted_price
+            params["price"] = adjusted["price"]
             params["timeInForce"] = "GTC"
         
-        self.logger.log_order(order_type, side.value, symbol, adjusted_qty, price)
+        self.logger.log_order(order_type, _SIDE[side], symbol, adjusted_qty, price)
         self.logger.info(f"Take Profit Price: {adjusted_stop}")
-        
+
+        return self._submit_order(params)
+
+    def place_limit_orders_batch(
+        self,
+        symbol: str,
+        orders: List[LimitOrderSpec],
+        time_in_force: str = "GTC"
+    ) -> List[Optional[OrderResponse]]:
+        """
+        Place multiple limit orders on one symbol via the batch endpoint.
+
+        Designed for ladder strategies: the symbol rules are fetched once,
+        every quantity/price is aligned against them in-memory, and orders
+        go out in chunks of 5 (the Binance batch limit), so N orders cost
+        ceil(N/5) round trips instead of N.
+
+        Args:
+            symbol: Trading pair symbol
+            orders: Order specs (side, qty, price per rung)
+            time_in_force: Time in force applied to every order
+
+        Returns:
+            One OrderResponse per input spec, or None where the exchange
+            rejected that individual order
+        """
+        self._ensure_connected()
+
+        rules = self._get_symbol_rules(symbol)
+
+        aligned = []
+        for spec in orders:
+            is_valid, msg, qty = self._check_quantity(rules, spec.qty)
+            if not is_valid:
+                raise ValueError(msg)
+            is_valid, msg, price = self._check_price(rules, spec.price)
+            if not is_valid:
+                raise ValueError(msg)
+            aligned.append({
+                "symbol": symbol,
+                "side": _SIDE[spec.side],
+                "type": "LIMIT",
+                "quantity": f"{qty:.{rules.qty_precision}f}",
+                "price": f"{price:.{rules.price_precision}f}",
+                "timeInForce": time_in_force,
+                "newClientOrderId": self._next_client_id()
+            })
+
+        results: List[Optional[OrderResponse]] = []
         try:
-            self.logger.log_api_request("POST", "/fapi/v1/order", params)
-            
-            order = self.client.futures_create_order(**params)
-            
-            self.logger.log_order_result(
-                order_id=str(order["orderId"]),
-                status=order["status"],
-                filled_qty=float(order.get("executedQty", 0)),
-                avg_price=float(order.get("avgPrice", 0))
-            )
-            
-            return self._format_order_response(order)
-            
+            for i in range(0, len(aligned), 5):
+                chunk = aligned[i:i + 5]
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.log_api_request("POST", "/fapi/v1/batchOrders", {
+                        "batchOrders": chunk
+                    })
+
+                # python-binance mutates and encodes the order list itself
+                response = self.client.futures_place_batch_order(
+                    batchOrders=chunk
+                )
+
+                # Each entry is either an order payload or a {code, msg} error
+                for entry in response:
+                    if "orderId" in entry:
+                        results.append(self._format_order_response(entry))
+                    else:
+                        self.logger.log_api_error(
+                            str(entry.get("code")), str(entry.get("msg"))
+                        )
+                        results.append(None)
+
+            placed = sum(1 for r in results if r is not None)
+            self.logger.info(f"Batch placed {placed}/{len(orders)} orders for {symbol}")
+            return results
+
         except BinanceAPIException as e:
             self.logger.log_api_error(str(e.code), e.message)
             raise
-    
+
+    def _ws_connect(self):
+        """Open the persistent WebSocket trade connection."""
+        url = WS_TRADE_TESTNET_URL if self.testnet else WS_TRADE_URL
+        self._ws_trade = websocket.create_connection(url, timeout=10)
+        self.logger.info(f"WebSocket trade connection established: {url}")
+
+    @staticmethod
+    def _ws_param_str(value: Any) -> str:
+        """Render a param the way it appears on the JSON wire."""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    def _ws_sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach apiKey/timestamp and an HMAC-SHA256 signature to params."""
+        payload = dict(params)
+        payload["apiKey"] = self.api_key
+        payload["timestamp"] = int(time.time() * 1000)
+        # Sign the wire form of each value - Python reprs like True would
+        # mismatch the JSON true the server verifies against
+        query = "&".join(
+            f"{k}={self._ws_param_str(payload[k])}" for k in sorted(payload)
+        )
+        payload["signature"] = hmac.new(
+            self.api_secret.encode(), query.encode(), hashlib.sha256
+        ).hexdigest()
+        return payload
+
+    def place_order_ws(self, params: Dict[str, Any]) -> OrderResponse:
+        """
+        Place an order over the WebSocket trade API.
+
+        Reuses a single persistent connection, skipping the HTTP
+        handshake/parse cost REST pays per order. Falls back to REST if the
+        websocket-client package is missing or the connection drops.
+
+        Args:
+            params: Raw order parameters (symbol, side, type, quantity, ...)
+
+        Returns:
+            Order result dictionary
+        """
+        if websocket is None:
+            self.logger.warning("websocket-client not installed, using REST")
+            return self._format_order_response(
+                self.client.futures_create_order(**params)
+            )
+
+        try:
+            with self._ws_lock:
+                if self._ws_trade is None:
+                    self._ws_connect()
+
+                request_id = next(self._ws_request_ids)
+                self._ws_trade.send(json.dumps({
+                    "id": request_id,
+                    "method": "order.place",
+                    "params": self._ws_sign(params)
+                }))
+
+                # Responses arrive in order on this connection; skip any
+                # stale frames until our correlation id comes back
+                while True:
+                    response = json.loads(self._ws_trade.recv())
+                    if response.get("id") == request_id:
+                        break
+
+        except (OSError, websocket.WebSocketException) as e:
+            # Transport failure: drop the connection and fall back to REST
+            self.logger.warning(f"WebSocket order failed, falling back to REST: {e}")
+            self._ws_trade = None
+            return self._format_order_response(
+                self.client.futures_create_order(**params)
+            )
+
+        if response.get("status") != 200:
+            error = response.get("error", {})
+            self.logger.log_api_error(str(error.get("code")), str(error.get("msg")))
+            raise ValueError(f"WebSocket order rejected: {error.get('msg')}")
+
+        return self._format_order_response(response["result"])
+
+    async def _run_async(self, func, *args, **kwargs):
+        """Run a blocking bot method on the executor from async code."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def place_market_order_async(self, *args, **kwargs) -> OrderResponse:
+        """Async wrapper for place_market_order; runs on the executor."""
+        return await self._run_async(self.place_market_order, *args, **kwargs)
+
+    async def place_limit_order_async(self, *args, **kwargs) -> OrderResponse:
+        """Async wrapper for place_limit_order; runs on the executor."""
+        return await self._run_async(self.place_limit_order, *args, **kwargs)
+
+    async def place_stop_limit_order_async(self, *args, **kwargs) -> OrderResponse:
+        """Async wrapper for place_stop_limit_order; runs on the executor."""
+        return await self._run_async(self.place_stop_limit_order, *args, **kwargs)
+
+    async def place_stop_market_order_async(self, *args, **kwargs) -> OrderResponse:
+        """Async wrapper for place_stop_market_order; runs on the executor."""
+        return await self._run_async(self.place_stop_market_order, *args, **kwargs)
+
+    async def place_take_profit_order_async(self, *args, **kwargs) -> OrderResponse:
+        """Async wrapper for place_take_profit_order; runs on the executor."""
+        return await self._run_async(self.place_take_profit_order, *args, **kwargs)
+
     def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """
         Cancel an open order.
@@ -627,6 +1161,8 @@ class BasicBot:
         Returns:
             Cancellation result
         """
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("DELETE", f"/fapi/v1/order", {
                 "symbol": symbol,
@@ -645,6 +1181,44 @@ class BasicBot:
             self.logger.log_api_error(str(e.code), e.message)
             raise
     
+    def cancel_orders(self, symbol: str, order_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Cancel multiple orders via the batch endpoint.
+
+        Binance accepts up to 10 order ids per batch request, so N orders
+        cost ceil(N/10) round trips instead of N.
+
+        Args:
+            symbol: Trading pair symbol
+            order_ids: Order IDs to cancel
+
+        Returns:
+            List of per-order cancellation results
+        """
+        self._ensure_connected()
+
+        results = []
+        try:
+            for i in range(0, len(order_ids), 10):
+                chunk = order_ids[i:i + 10]
+                self.logger.log_api_request("DELETE", "/fapi/v1/batchOrders", {
+                    "symbol": symbol,
+                    "orderIdList": chunk
+                })
+                # python-binance only JSON-encodes the id list under the
+                # lowercase orderidlist key
+                results.extend(self.client.futures_cancel_orders(
+                    symbol=symbol,
+                    orderidlist=chunk
+                ))
+
+            self.logger.info(f"Cancelled {len(order_ids)} orders for {symbol}")
+            return results
+
+        except BinanceAPIException as e:
+            self.logger.log_api_error(str(e.code), e.message)
+            raise
+
     def cancel_all_orders(self, symbol: str) -> Dict[str, Any]:
         """
         Cancel all open orders for a symbol.
@@ -655,6 +1229,8 @@ class BasicBot:
         Returns:
             Cancellation result
         """
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("DELETE", "/fapi/v1/allOpenOrders", {"symbol": symbol})
             
@@ -667,7 +1243,7 @@ class BasicBot:
             self.logger.log_api_error(str(e.code), e.message)
             raise
     
-    def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[OrderResponse]:
         """
         Get all open orders.
         
@@ -677,6 +1253,8 @@ class BasicBot:
         Returns:
             List of open orders
         """
+        self._ensure_connected()
+
         try:
             params = {"symbol": symbol} if symbol else {}
             self.logger.log_api_request("GET", "/fapi/v1/openOrders", params)
@@ -693,7 +1271,7 @@ class BasicBot:
             self.logger.log_api_error(str(e.code), e.message)
             raise
     
-    def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    def get_order_status(self, symbol: str, order_id: int) -> OrderResponse:
         """
         Get status of a specific order.
         
@@ -704,6 +1282,8 @@ class BasicBot:
         Returns:
             Order status dictionary
         """
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("GET", "/fapi/v1/order", {
                 "symbol": symbol,
@@ -728,30 +1308,33 @@ class BasicBot:
         Returns:
             List of positions
         """
+        self._ensure_connected()
+
         try:
             self.logger.log_api_request("GET", "/fapi/v2/positionRisk")
             
             positions = self.client.futures_position_information()
-            
-            if symbol:
-                positions = [p for p in positions if p["symbol"] == symbol]
-            
-            # Filter to only positions with non-zero quantity
-            active_positions = []
-            for pos in positions:
-                if float(pos["positionAmt"]) != 0:
-                    active_positions.append({
-                        "symbol": pos["symbol"],
-                        "position_amount": float(pos["positionAmt"]),
-                        "entry_price": float(pos["entryPrice"]),
-                        "mark_price": float(pos["markPrice"]),
-                        "unrealized_pnl": float(pos["unRealizedProfit"]),
-                        "liquidation_price": float(pos["liquidationPrice"]),
-                        "leverage": int(pos["leverage"]),
-                        "margin_type": pos["marginType"],
-                        "position_side": pos["positionSide"]
-                    })
-            
+
+            # Filter to only positions with non-zero quantity, parsing
+            # positionAmt exactly once per row and skipping non-matching
+            # symbols before any float conversion
+            active_positions = [
+                {
+                    "symbol": pos["symbol"],
+                    "position_amount": amount,
+                    "entry_price": float(pos["entryPrice"]),
+                    "mark_price": float(pos["markPrice"]),
+                    "unrealized_pnl": float(pos["unRealizedProfit"]),
+                    "liquidation_price": float(pos["liquidationPrice"]),
+                    "leverage": int(pos["leverage"]),
+                    "margin_type": pos["marginType"],
+                    "position_side": pos["positionSide"]
+                }
+                for pos in positions
+                if (symbol is None or pos["symbol"] == symbol)
+                and (amount := float(pos["positionAmt"])) != 0.0
+            ]
+
             self.logger.info(f"Retrieved {len(active_positions)} active positions")
             return active_positions
             
@@ -770,6 +1353,8 @@ class BasicBot:
         Returns:
             Result dictionary
         """
+        self._ensure_connected()
+
         if leverage < 1 or leverage > 125:
             raise ValueError("Leverage must be between 1 and 125")
         
@@ -791,23 +1376,6 @@ class BasicBot:
             self.logger.log_api_error(str(e.code), e.message)
             raise
     
-    def _format_order_response(self, order: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_order_response(self, order: Dict[str, Any]) -> OrderResponse:
         """Format order response for consistent output."""
-        return {
-            "order_id": order.get("orderId"),
-            "client_order_id": order.get("clientOrderId"),
-            "symbol": order.get("symbol"),
-            "side": order.get("side"),
-            "type": order.get("type"),
-            "status": order.get("status"),
-            "price": float(order.get("price", 0)),
-            "quantity": float(order.get("origQty", 0)),
-            "executed_qty": float(order.get("executedQty", 0)),
-            "avg_price": float(order.get("avgPrice", 0)),
-            "stop_price": float(order.get("stopPrice", 0)) if order.get("stopPrice") else None,
-            "time_in_force": order.get("timeInForce"),
-            "reduce_only": order.get("reduceOnly", False),
-            "close_position": order.get("closePosition", False),
-            "working_type": order.get("workingType"),
-            "update_time": order.get("updateTime")
-        }
+        return OrderResponse.from_raw(order)
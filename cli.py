@@ -4,112 +4,222 @@ Provides interactive menu-driven interface for trading operations.
 """
 
 import argparse
+import asyncio
+import functools
+import re
 import sys
 import os
-from typing import Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from getpass import getpass
 
-from bot import BasicBot, OrderSide, OrderType
-from config import BotConfig
+from bot import BasicBot, OrderSide
 from logger import get_logger
 
+# Reference prices shown in prompts may be slightly stale
+PRICE_CACHE_TTL = 1.5
+
+# Validate numeric input up front instead of paying for a raised ValueError
+_INT_RE = re.compile(r"[+-]?\d+\Z")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\Z")
+
+_SIDE_MAP = {"BUY": OrderSide.BUY, "SELL": OrderSide.SELL}
+_TIF_SET = frozenset({"GTC", "IOC", "FOK"})
+
+
+async def _prompt_in_thread(func, *args):
+    """
+    Run a blocking console read (input/getpass) on a daemon thread.
+
+    asyncio.to_thread would use the default executor, whose threads are
+    joined at shutdown - a reader still stuck in input() would then make
+    Ctrl+C hang until the user presses Enter. A daemon thread is simply
+    abandoned when the process exits.
+    """
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def reader():
+        try:
+            result = func(*args)
+        except BaseException as exc:
+            outcome, value = fut.set_exception, exc
+        else:
+            outcome, value = fut.set_result, result
+        try:
+            loop.call_soon_threadsafe(
+                lambda: outcome(value) if not fut.done() else None
+            )
+        except RuntimeError:
+            pass  # loop already closed mid-read
+
+    threading.Thread(target=reader, daemon=True, name="cli-input").start()
+    return await fut
+
+
+@functools.lru_cache(maxsize=64)
+def _canon_symbol(symbol: str) -> str:
+    """Canonicalize a trading symbol to uppercase."""
+    # Most input is already uppercase; skip the copy in that case
+    return symbol if symbol.isupper() else symbol.upper()
+
+
+def _require_bot(handler):
+    """Reject a menu handler until the bot has been initialized."""
+    @functools.wraps(handler)
+    async def wrapper(self, *args, **kwargs):
+        if not await self._ensure_bot_ready():
+            print("❌ Bot not initialized.")
+            return None
+        return await handler(self, *args, **kwargs)
+    return wrapper
+
+# Static screens are built once and written in a single syscall
+HEADER_TEXT = "\n".join([
+    "",
+    "=" * 60,
+    "   BINANCE FUTURES TRADING BOT - TESTNET",
+    "=" * 60,
+    "   ⚠️  TESTNET MODE - No real funds at risk",
+    "=" * 60,
+    "",
+    "",
+])
+
+MENU_TEXT = "\n".join([
+    "",
+    "-" * 40,
+    "MAIN MENU",
+    "-" * 40,
+    "1.  View Account Balance",
+    "2.  View Current Price",
+    "3.  Place Market Order",
+    "4.  Place Limit Order",
+    "5.  Place Stop-Limit Order",
+    "6.  Place Stop-Market Order",
+    "7.  Place Take-Profit Order",
+    "8.  View Open Orders",
+    "9.  Cancel Order",
+    "10. Cancel All Orders",
+    "11. View Positions",
+    "12. Set Leverage",
+    "13. Get Order Status",
+    "0.  Exit",
+    "-" * 40,
+    "",
+])
+
 
 class TradingCLI:
     """Command-line interface for the trading bot."""
-    
+
     def __init__(self):
         self.bot: Optional[BasicBot] = None
         self.logger = get_logger(name="CLI", log_level="INFO")
         self.running = True
-    
+        self._menu_dirty = True
+        self._bot_task: Optional[asyncio.Task] = None
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self._actions = {
+            "0": self._exit,
+            "1": self.handle_view_balance,
+            "2": self.handle_view_price,
+            "3": self.handle_market_order,
+            "4": self.handle_limit_order,
+            "5": self.handle_stop_limit_order,
+            "6": self.handle_stop_market_order,
+            "7": self.handle_take_profit_order,
+            "8": self.handle_view_orders,
+            "9": self.handle_cancel_order,
+            "10": self.handle_cancel_all_orders,
+            "11": self.handle_view_positions,
+            "12": self.handle_set_leverage,
+            "13": self.handle_get_order_status,
+        }
+
+    async def _exit(self):
+        """Leave the main loop."""
+        print("\n👋 Goodbye!")
+        self.running = False
+
+    def _cached_price(self, symbol: str) -> float:
+        """Get the current price, reusing a recent quote when available."""
+        cached = self._price_cache.get(symbol)
+        now = time.monotonic()
+        if cached and now - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
+        price = self.bot.get_current_price(symbol)
+        self._price_cache[symbol] = (now, price)
+        return price
+
     def print_header(self):
         """Print application header."""
-        print("\n" + "=" * 60)
-        print("   BINANCE FUTURES TRADING BOT - TESTNET")
-        print("=" * 60)
-        print("   ⚠️  TESTNET MODE - No real funds at risk")
-        print("=" * 60 + "\n")
-    
+        sys.stdout.write(HEADER_TEXT)
+        sys.stdout.flush()
+
     def print_menu(self):
         """Print main menu options."""
-        print("\n" + "-" * 40)
-        print("MAIN MENU")
-        print("-" * 40)
-        print("1.  View Account Balance")
-        print("2.  View Current Price")
-        print("3.  Place Market Order")
-        print("4.  Place Limit Order")
-        print("5.  Place Stop-Limit Order")
-        print("6.  Place Stop-Market Order")
-        print("7.  Place Take-Profit Order")
-        print("8.  View Open Orders")
-        print("9.  Cancel Order")
-        print("10. Cancel All Orders")
-        print("11. View Positions")
-        print("12. Set Leverage")
-        print("13. Get Order Status")
-        print("0.  Exit")
-        print("-" * 40)
-    
-    def get_input(self, prompt: str, required: bool = True, default: Optional[str] = None) -> str:
+        sys.stdout.write(MENU_TEXT)
+        sys.stdout.flush()
+
+    async def get_input(self, prompt: str, required: bool = True, default: Optional[str] = None) -> str:
         """Get user input with optional default value."""
         if default:
             prompt = f"{prompt} [{default}]: "
         else:
             prompt = f"{prompt}: "
-        
+
         while True:
-            value = input(prompt).strip()
-            
+            # input() blocks; run it on a daemon thread so bot calls
+            # already in flight keep making progress
+            value = (await _prompt_in_thread(input, prompt)).strip()
+
             if not value and default:
                 return default
-            
+
             if not value and required:
                 print("❌ This field is required. Please enter a value.")
                 continue
-            
+
             return value
-    
-    def get_float_input(self, prompt: str, default: Optional[float] = None) -> float:
+
+    async def get_float_input(self, prompt: str, default: Optional[float] = None) -> float:
         """Get float input from user."""
         while True:
-            try:
-                if default is not None:
-                    value = self.get_input(prompt, default=str(default))
-                else:
-                    value = self.get_input(prompt)
+            if default is not None:
+                value = await self.get_input(prompt, default=str(default))
+            else:
+                value = await self.get_input(prompt)
+            if _FLOAT_RE.match(value):
                 return float(value)
-            except ValueError:
-                print("❌ Please enter a valid number.")
-    
-    def get_int_input(self, prompt: str, default: Optional[int] = None) -> int:
+            print("❌ Please enter a valid number.")
+
+    async def get_int_input(self, prompt: str, default: Optional[int] = None) -> int:
         """Get integer input from user."""
         while True:
-            try:
-                if default is not None:
-                    value = self.get_input(prompt, default=str(default))
-                else:
-                    value = self.get_input(prompt)
+            if default is not None:
+                value = await self.get_input(prompt, default=str(default))
+            else:
+                value = await self.get_input(prompt)
+            if _INT_RE.match(value):
                 return int(value)
-            except ValueError:
-                print("❌ Please enter a valid integer.")
-    
-    def get_side_input(self) -> OrderSide:
+            print("❌ Please enter a valid integer.")
+
+    async def get_side_input(self) -> OrderSide:
         """Get order side from user."""
         while True:
-            side = self.get_input("Order Side (BUY/SELL)").upper()
-            if side == "BUY":
-                return OrderSide.BUY
-            elif side == "SELL":
-                return OrderSide.SELL
-            else:
-                print("❌ Please enter BUY or SELL.")
-    
-    def get_yes_no_input(self, prompt: str, default: bool = False) -> bool:
+            side = (await self.get_input("Order Side (BUY/SELL)")).upper()
+            result = _SIDE_MAP.get(side)
+            if result is not None:
+                return result
+            print("❌ Please enter BUY or SELL.")
+
+    async def get_yes_no_input(self, prompt: str, default: bool = False) -> bool:
         """Get yes/no input from user."""
         default_str = "Y/n" if default else "y/N"
         while True:
-            value = self.get_input(f"{prompt} ({default_str})", required=False)
+            value = await self.get_input(f"{prompt} ({default_str})", required=False)
             if not value:
                 return default
             if value.lower() in ["y", "yes"]:
@@ -117,154 +227,217 @@ class TradingCLI:
             if value.lower() in ["n", "no"]:
                 return False
             print("❌ Please enter Y or N.")
-    
-    def display_order_result(self, order: dict):
+
+    def _start_price_task(self, symbol: str) -> Optional[asyncio.Task]:
+        """Kick off a background price fetch to overlap with user typing."""
+        if self.bot is None:
+            return None
+        return asyncio.create_task(
+            asyncio.to_thread(self._cached_price, symbol)
+        )
+
+    async def _show_price_task(self, symbol: str, price_task: Optional[asyncio.Task]):
+        """Print the reference price fetched by _start_price_task, if any."""
+        if price_task is None:
+            return
+        try:
+            current_price = await price_task
+            print(f"📊 Current {symbol} price: {current_price}")
+        except Exception:
+            pass
+
+    def display_order_result(self, order):
         """Display order result in formatted way."""
-        print("\n" + "=" * 50)
-        print("ORDER EXECUTED")
-        print("=" * 50)
-        print(f"  Order ID:      {order['order_id']}")
-        print(f"  Symbol:        {order['symbol']}")
-        print(f"  Side:          {order['side']}")
-        print(f"  Type:          {order['type']}")
-        print(f"  Status:        {order['status']}")
-        print(f"  Quantity:      {order['quantity']}")
-        print(f"  Executed Qty:  {order['executed_qty']}")
-        if order['price']:
-            print(f"  Price:         {order['price']}")
-        if order['avg_price']:
-            print(f"  Avg Price:     {order['avg_price']}")
-        if order['stop_price']:
-            print(f"  Stop Price:    {order['stop_price']}")
-        print("=" * 50)
-    
+        lines = [
+            "",
+            "=" * 50,
+            "ORDER EXECUTED",
+            "=" * 50,
+            f"  Order ID:      {order.order_id}",
+            f"  Symbol:        {order.symbol}",
+            f"  Side:          {order.side}",
+            f"  Type:          {order.type}",
+            f"  Status:        {order.status}",
+            f"  Quantity:      {order.quantity}",
+            f"  Executed Qty:  {order.executed_qty}",
+        ]
+        if order.price:
+            lines.append(f"  Price:         {order.price}")
+        if order.avg_price:
+            lines.append(f"  Avg Price:     {order.avg_price}")
+        if order.stop_price:
+            lines.append(f"  Stop Price:    {order.stop_price}")
+        lines.append("=" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def display_balance(self, balance: dict):
         """Display balance information."""
-        print("\n" + "=" * 40)
-        print("ACCOUNT BALANCE")
-        print("=" * 40)
-        print(f"  Asset:          {balance['asset']}")
-        print(f"  Total Balance:  {balance['balance']:.4f}")
-        print(f"  Available:      {balance['available']:.4f}")
-        print(f"  Cross Wallet:   {balance['cross_wallet']:.4f}")
-        print("=" * 40)
-    
+        buf = (
+            f"\n{'=' * 40}\n"
+            "ACCOUNT BALANCE\n"
+            f"{'=' * 40}\n"
+            f"  Asset:          {balance['asset']}\n"
+            f"  Total Balance:  {balance['balance']:.4f}\n"
+            f"  Available:      {balance['available']:.4f}\n"
+            f"  Cross Wallet:   {balance['cross_wallet']:.4f}\n"
+            f"{'=' * 40}\n"
+        )
+        sys.stdout.write(buf)
+        sys.stdout.flush()
+
     def display_positions(self, positions: list):
         """Display positions information."""
-        print("\n" + "=" * 60)
-        print("CURRENT POSITIONS")
-        print("=" * 60)
-        
+        sep40 = "-" * 40
+        sep60 = "=" * 60
+        lines = [
+            "",
+            sep60,
+            "CURRENT POSITIONS",
+            sep60,
+        ]
+
         if not positions:
-            print("  No active positions.")
+            lines.append("  No active positions.")
         else:
+            append = lines.append
             for pos in positions:
-                print(f"\n  Symbol:          {pos['symbol']}")
-                print(f"  Position:        {pos['position_amount']}")
-                print(f"  Entry Price:     {pos['entry_price']:.2f}")
-                print(f"  Mark Price:      {pos['mark_price']:.2f}")
-                print(f"  Unrealized PnL:  {pos['unrealized_pnl']:.4f}")
-                print(f"  Liquidation:     {pos['liquidation_price']:.2f}")
-                print(f"  Leverage:        {pos['leverage']}x")
-                print("-" * 40)
-        
-        print("=" * 60)
-    
+                append(f"\n  Symbol:          {pos['symbol']}")
+                append(f"  Position:        {pos['position_amount']}")
+                append(f"  Entry Price:     {pos['entry_price']:.2f}")
+                append(f"  Mark Price:      {pos['mark_price']:.2f}")
+                append(f"  Unrealized PnL:  {pos['unrealized_pnl']:.4f}")
+                append(f"  Liquidation:     {pos['liquidation_price']:.2f}")
+                append(f"  Leverage:        {pos['leverage']}x")
+                append(sep40)
+
+        lines.append(sep60)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def display_orders(self, orders: list):
         """Display open orders."""
-        print("\n" + "=" * 60)
-        print("OPEN ORDERS")
-        print("=" * 60)
-        
+        sep40 = "-" * 40
+        sep60 = "=" * 60
+        lines = [
+            "",
+            sep60,
+            "OPEN ORDERS",
+            sep60,
+        ]
+
         if not orders:
-            print("  No open orders.")
+            lines.append("  No open orders.")
         else:
+            append = lines.append
             for order in orders:
-                print(f"\n  Order ID:    {order['order_id']}")
-                print(f"  Symbol:      {order['symbol']}")
-                print(f"  Side:        {order['side']}")
-                print(f"  Type:        {order['type']}")
-                print(f"  Status:      {order['status']}")
-                print(f"  Quantity:    {order['quantity']}")
-                print(f"  Price:       {order['price']}")
-                if order['stop_price']:
-                    print(f"  Stop Price:  {order['stop_price']}")
-                print("-" * 40)
-        
-        print("=" * 60)
-    
-    def initialize_bot(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+                append(f"\n  Order ID:    {order.order_id}")
+                append(f"  Symbol:      {order.symbol}")
+                append(f"  Side:        {order.side}")
+                append(f"  Type:        {order.type}")
+                append(f"  Status:      {order.status}")
+                append(f"  Quantity:    {order.quantity}")
+                append(f"  Price:       {order.price}")
+                if order.stop_price:
+                    append(f"  Stop Price:  {order.stop_price}")
+                append(sep40)
+
+        lines.append(sep60)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    async def initialize_bot(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
         """Initialize the trading bot with API credentials."""
         # Try to get credentials from arguments, environment, or user input
         if not api_key:
             api_key = os.getenv("BINANCE_API_KEY")
         if not api_secret:
             api_secret = os.getenv("BINANCE_API_SECRET")
-        
+
+        if (not api_key or not api_secret) and not sys.stdin.isatty():
+            # Non-interactive runs must not hang on a prompt
+            print("❌ Missing credentials and no TTY to prompt for them.")
+            return False
+
         if not api_key:
             print("\nPlease enter your Binance Testnet API credentials:")
             print("(Get them from: https://testnet.binancefuture.com)")
-            api_key = self.get_input("API Key")
-        
+            api_key = await self.get_input("API Key")
+
         if not api_secret:
-            api_secret = getpass("API Secret: ")
-        
-        try:
-            print("\n⏳ Connecting to Binance Futures Testnet...")
-            self.bot = BasicBot(
+            api_secret = await _prompt_in_thread(getpass, "API Secret: ")
+
+        # Start the connect (REST handshake, time sync) in the background
+        # and return immediately; _ensure_bot_ready joins it when the
+        # first menu action actually needs the bot
+        print("\n⏳ Connecting to Binance Futures Testnet in the background...")
+        self._bot_task = asyncio.create_task(
+            asyncio.to_thread(
+                BasicBot,
                 api_key=api_key,
                 api_secret=api_secret,
                 testnet=True
             )
-            print("✅ Connected successfully!")
+        )
+        return True
+
+    async def _ensure_bot_ready(self) -> bool:
+        """Resolve the background connect, if one is still pending."""
+        if self.bot is not None:
             return True
+        if self._bot_task is None:
+            return False
+        try:
+            self.bot = await self._bot_task
         except Exception as e:
+            # No bot will ever materialize; bail out like the old
+            # foreground connect did instead of looping uselessly
             print(f"❌ Failed to connect: {e}")
-            return False
-    
-    def handle_view_balance(self):
+            print("\n⚠️  Failed to initialize bot. Exiting...")
+            sys.exit(1)
+        finally:
+            self._bot_task = None
+        print("✅ Connected successfully!")
+        return True
+
+    @_require_bot
+    async def handle_view_balance(self):
         """Handle view balance action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        asset = self.get_input("Asset", default="USDT")
+        asset = await self.get_input("Asset", default="USDT")
         try:
-            balance = self.bot.get_balance(asset)
+            balance = await asyncio.to_thread(self.bot.get_balance, asset)
             self.display_balance(balance)
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_view_price(self):
+
+    @_require_bot
+    async def handle_view_price(self):
         """Handle view price action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
         try:
-            price = self.bot.get_current_price(symbol)
+            price = await asyncio.to_thread(self._cached_price, symbol)
             print(f"\n💰 Current {symbol} Price: {price}")
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_market_order(self):
+
+    @_require_bot
+    async def handle_market_order(self):
         """Handle market order placement."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
         print("\n--- MARKET ORDER ---")
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
-        side = self.get_side_input()
-        quantity = self.get_float_input("Quantity")
-        reduce_only = self.get_yes_no_input("Reduce Only?", default=False)
-        
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
+        side = await self.get_side_input()
+        quantity = await self.get_float_input("Quantity")
+        reduce_only = await self.get_yes_no_input("Reduce Only?", default=False)
+
         # Confirm order
         print(f"\n📋 Order Summary: {side.value} {quantity} {symbol} @ MARKET")
-        if not self.get_yes_no_input("Confirm order?"):
+        if not await self.get_yes_no_input("Confirm order?"):
             print("❌ Order cancelled.")
             return
-        
+
         try:
-            order = self.bot.place_market_order(
+            order = await asyncio.to_thread(
+                self.bot.place_market_order,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -273,36 +446,36 @@ class TradingCLI:
             self.display_order_result(order)
         except Exception as e:
             print(f"❌ Order failed: {e}")
-    
-    def handle_limit_order(self):
+
+    @_require_bot
+    async def handle_limit_order(self):
         """Handle limit order placement."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
         print("\n--- LIMIT ORDER ---")
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
-        
-        # Show current price for reference
-        try:
-            current_price = self.bot.get_current_price(symbol)
-            print(f"📊 Current {symbol} price: {current_price}")
-        except:
-            pass
-        
-        side = self.get_side_input()
-        quantity = self.get_float_input("Quantity")
-        price = self.get_float_input("Limit Price")
-        tif = self.get_input("Time in Force (GTC/IOC/FOK)", default="GTC").upper()
-        reduce_only = self.get_yes_no_input("Reduce Only?", default=False)
-        
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
+
+        # Fetch the reference price while the user types the next answers
+        price_task = self._start_price_task(symbol)
+
+        side = await self.get_side_input()
+        await self._show_price_task(symbol, price_task)
+        quantity = await self.get_float_input("Quantity")
+        price = await self.get_float_input("Limit Price")
+        tif = (await self.get_input("Time in Force (GTC/IOC/FOK)", default="GTC")).upper()
+        if tif not in _TIF_SET:
+            # Catch it here rather than paying a round-trip for a rejection
+            print(f"❌ Invalid time in force: {tif}. Use GTC, IOC or FOK.")
+            return
+        reduce_only = await self.get_yes_no_input("Reduce Only?", default=False)
+
         # Confirm order
         print(f"\n📋 Order Summary: {side.value} {quantity} {symbol} @ {price}")
-        if not self.get_yes_no_input("Confirm order?"):
+        if not await self.get_yes_no_input("Confirm order?"):
             print("❌ Order cancelled.")
             return
-        
+
         try:
-            order = self.bot.place_limit_order(
+            order = await asyncio.to_thread(
+                self.bot.place_limit_order,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -313,35 +486,31 @@ class TradingCLI:
             self.display_order_result(order)
         except Exception as e:
             print(f"❌ Order failed: {e}")
-    
-    def handle_stop_limit_order(self):
+
+    @_require_bot
+    async def handle_stop_limit_order(self):
         """Handle stop-limit order placement."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
         print("\n--- STOP-LIMIT ORDER ---")
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
-        
-        try:
-            current_price = self.bot.get_current_price(symbol)
-            print(f"📊 Current {symbol} price: {current_price}")
-        except:
-            pass
-        
-        side = self.get_side_input()
-        quantity = self.get_float_input("Quantity")
-        stop_price = self.get_float_input("Stop Price (trigger)")
-        price = self.get_float_input("Limit Price (execution)")
-        reduce_only = self.get_yes_no_input("Reduce Only?", default=False)
-        
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
+
+        price_task = self._start_price_task(symbol)
+
+        side = await self.get_side_input()
+        await self._show_price_task(symbol, price_task)
+        quantity = await self.get_float_input("Quantity")
+        stop_price = await self.get_float_input("Stop Price (trigger)")
+        price = await self.get_float_input("Limit Price (execution)")
+        reduce_only = await self.get_yes_no_input("Reduce Only?", default=False)
+
         print(f"\n📋 Order Summary: {side.value} {quantity} {symbol}")
         print(f"    Stop @ {stop_price} → Limit @ {price}")
-        if not self.get_yes_no_input("Confirm order?"):
+        if not await self.get_yes_no_input("Confirm order?"):
             print("❌ Order cancelled.")
             return
-        
+
         try:
-            order = self.bot.place_stop_limit_order(
+            order = await asyncio.to_thread(
+                self.bot.place_stop_limit_order,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -352,34 +521,30 @@ class TradingCLI:
             self.display_order_result(order)
         except Exception as e:
             print(f"❌ Order failed: {e}")
-    
-    def handle_stop_market_order(self):
+
+    @_require_bot
+    async def handle_stop_market_order(self):
         """Handle stop-market order placement."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
         print("\n--- STOP-MARKET ORDER ---")
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
-        
-        try:
-            current_price = self.bot.get_current_price(symbol)
-            print(f"📊 Current {symbol} price: {current_price}")
-        except:
-            pass
-        
-        side = self.get_side_input()
-        quantity = self.get_float_input("Quantity")
-        stop_price = self.get_float_input("Stop Price (trigger)")
-        reduce_only = self.get_yes_no_input("Reduce Only?", default=False)
-        
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
+
+        price_task = self._start_price_task(symbol)
+
+        side = await self.get_side_input()
+        await self._show_price_task(symbol, price_task)
+        quantity = await self.get_float_input("Quantity")
+        stop_price = await self.get_float_input("Stop Price (trigger)")
+        reduce_only = await self.get_yes_no_input("Reduce Only?", default=False)
+
         print(f"\n📋 Order Summary: {side.value} {quantity} {symbol}")
         print(f"    Stop @ {stop_price} → MARKET")
-        if not self.get_yes_no_input("Confirm order?"):
+        if not await self.get_yes_no_input("Confirm order?"):
             print("❌ Order cancelled.")
             return
-        
+
         try:
-            order = self.bot.place_stop_market_order(
+            order = await asyncio.to_thread(
+                self.bot.place_stop_market_order,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -389,38 +554,34 @@ class TradingCLI:
             self.display_order_result(order)
         except Exception as e:
             print(f"❌ Order failed: {e}")
-    
-    def handle_take_profit_order(self):
+
+    @_require_bot
+    async def handle_take_profit_order(self):
         """Handle take-profit order placement."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
         print("\n--- TAKE-PROFIT ORDER ---")
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
-        
-        try:
-            current_price = self.bot.get_current_price(symbol)
-            print(f"📊 Current {symbol} price: {current_price}")
-        except:
-            pass
-        
-        side = self.get_side_input()
-        quantity = self.get_float_input("Quantity")
-        stop_price = self.get_float_input("Take Profit Price (trigger)")
-        
-        use_limit = self.get_yes_no_input("Use limit price?", default=False)
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
+
+        price_task = self._start_price_task(symbol)
+
+        side = await self.get_side_input()
+        await self._show_price_task(symbol, price_task)
+        quantity = await self.get_float_input("Quantity")
+        stop_price = await self.get_float_input("Take Profit Price (trigger)")
+
+        use_limit = await self.get_yes_no_input("Use limit price?", default=False)
         price = None
         if use_limit:
-            price = self.get_float_input("Limit Price (execution)")
-        
+            price = await self.get_float_input("Limit Price (execution)")
+
         print(f"\n📋 Order Summary: {side.value} {quantity} {symbol}")
         print(f"    TP @ {stop_price}" + (f" → Limit @ {price}" if price else " → MARKET"))
-        if not self.get_yes_no_input("Confirm order?"):
+        if not await self.get_yes_no_input("Confirm order?"):
             print("❌ Order cancelled.")
             return
-        
+
         try:
-            order = self.bot.place_take_profit_order(
+            order = await asyncio.to_thread(
+                self.bot.place_take_profit_order,
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
@@ -430,153 +591,118 @@ class TradingCLI:
             self.display_order_result(order)
         except Exception as e:
             print(f"❌ Order failed: {e}")
-    
-    def handle_view_orders(self):
+
+    @_require_bot
+    async def handle_view_orders(self):
         """Handle view open orders action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol (leave empty for all)", required=False)
-        symbol = symbol.upper() if symbol else None
-        
+        symbol = await self.get_input("Symbol (leave empty for all)", required=False)
+        symbol = _canon_symbol(symbol) if symbol else None
+
         try:
-            orders = self.bot.get_open_orders(symbol)
+            orders = await asyncio.to_thread(self.bot.get_open_orders, symbol)
             self.display_orders(orders)
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_cancel_order(self):
+
+    @_require_bot
+    async def handle_cancel_order(self):
         """Handle cancel order action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol").upper()
-        order_id = self.get_int_input("Order ID")
-        
-        if not self.get_yes_no_input(f"Cancel order {order_id}?"):
+        symbol = _canon_symbol(await self.get_input("Symbol"))
+        order_id = await self.get_int_input("Order ID")
+
+        if not await self.get_yes_no_input(f"Cancel order {order_id}?"):
             print("❌ Cancellation aborted.")
             return
-        
+
         try:
-            self.bot.cancel_order(symbol, order_id)
+            await asyncio.to_thread(self.bot.cancel_order, symbol, order_id)
             print(f"✅ Order {order_id} cancelled successfully.")
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_cancel_all_orders(self):
+
+    @_require_bot
+    async def handle_cancel_all_orders(self):
         """Handle cancel all orders action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol").upper()
-        
-        if not self.get_yes_no_input(f"Cancel ALL orders for {symbol}?"):
+        symbol = _canon_symbol(await self.get_input("Symbol"))
+
+        if not await self.get_yes_no_input(f"Cancel ALL orders for {symbol}?"):
             print("❌ Cancellation aborted.")
             return
-        
+
         try:
-            self.bot.cancel_all_orders(symbol)
+            await asyncio.to_thread(self.bot.cancel_all_orders, symbol)
             print(f"✅ All orders for {symbol} cancelled.")
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_view_positions(self):
+
+    @_require_bot
+    async def handle_view_positions(self):
         """Handle view positions action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol (leave empty for all)", required=False)
-        symbol = symbol.upper() if symbol else None
-        
+        symbol = await self.get_input("Symbol (leave empty for all)", required=False)
+        symbol = _canon_symbol(symbol) if symbol else None
+
         try:
-            positions = self.bot.get_positions(symbol)
+            positions = await asyncio.to_thread(self.bot.get_positions, symbol)
             self.display_positions(positions)
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_set_leverage(self):
+
+    @_require_bot
+    async def handle_set_leverage(self):
         """Handle set leverage action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol", default="BTCUSDT").upper()
-        leverage = self.get_int_input("Leverage (1-125)", default=10)
-        
+        symbol = _canon_symbol(await self.get_input("Symbol", default="BTCUSDT"))
+        leverage = await self.get_int_input("Leverage (1-125)", default=10)
+
         try:
-            result = self.bot.set_leverage(symbol, leverage)
+            result = await asyncio.to_thread(self.bot.set_leverage, symbol, leverage)
             print(f"✅ Leverage for {symbol} set to {leverage}x")
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def handle_get_order_status(self):
+
+    @_require_bot
+    async def handle_get_order_status(self):
         """Handle get order status action."""
-        if self.bot is None:
-            print("❌ Bot not initialized.")
-            return
-        symbol = self.get_input("Symbol").upper()
-        order_id = self.get_int_input("Order ID")
-        
+        symbol = _canon_symbol(await self.get_input("Symbol"))
+        order_id = await self.get_int_input("Order ID")
+
         try:
-            order = self.bot.get_order_status(symbol, order_id)
+            order = await asyncio.to_thread(self.bot.get_order_status, symbol, order_id)
             self.display_order_result(order)
         except Exception as e:
             print(f"❌ Error: {e}")
-    
-    def run(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+
+    async def run(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
         """Run the CLI main loop."""
         self.print_header()
-        
-        if not self.initialize_bot(api_key, api_secret):
+
+        if not await self.initialize_bot(api_key, api_secret):
             print("\n⚠️  Failed to initialize bot. Exiting...")
             sys.exit(1)
-        
+
         while self.running:
             try:
-                self.print_menu()
-                choice = self.get_input("Select option", default="0")
-                
-                if choice == "0":
-                    print("\n👋 Goodbye!")
-                    self.running = False
-                elif choice == "1":
-                    self.handle_view_balance()
-                elif choice == "2":
-                    self.handle_view_price()
-                elif choice == "3":
-                    self.handle_market_order()
-                elif choice == "4":
-                    self.handle_limit_order()
-                elif choice == "5":
-                    self.handle_stop_limit_order()
-                elif choice == "6":
-                    self.handle_stop_market_order()
-                elif choice == "7":
-                    self.handle_take_profit_order()
-                elif choice == "8":
-                    self.handle_view_orders()
-                elif choice == "9":
-                    self.handle_cancel_order()
-                elif choice == "10":
-                    self.handle_cancel_all_orders()
-                elif choice == "11":
-                    self.handle_view_positions()
-                elif choice == "12":
-                    self.handle_set_leverage()
-                elif choice == "13":
-                    self.handle_get_order_status()
+                # Redraw the full menu only after a handler has scrolled
+                # the screen; a typo just gets the prompt again
+                if self._menu_dirty:
+                    self.print_menu()
+                    self._menu_dirty = False
+                choice = await self.get_input("Select option", default="0")
+
+                action = self._actions.get(choice)
+                if action is not None:
+                    await action()
+                    self._menu_dirty = True
                 else:
                     print("❌ Invalid option. Please try again.")
-                    
-            except KeyboardInterrupt:
-                print("\n\n👋 Interrupted. Goodbye!")
-                self.running = False
+
             except Exception as e:
                 print(f"\n❌ Unexpected error: {e}")
                 self.logger.error(f"Unexpected error: {e}")
 
 
-def main():
-    """Main entry point."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Binance Futures Trading Bot - Testnet",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -584,7 +710,7 @@ def main():
 Examples:
   python cli.py                           # Interactive mode
   python cli.py --api-key KEY --api-secret SECRET
-  
+
 Environment Variables:
   BINANCE_API_KEY      Your Binance Testnet API key
   BINANCE_API_SECRET   Your Binance Testnet API secret
@@ -592,7 +718,7 @@ Environment Variables:
 Get testnet credentials at: https://testnet.binancefuture.com
         """
     )
-    
+
     parser.add_argument(
         "--api-key",
         help="Binance API key (or set BINANCE_API_KEY env var)"
@@ -601,11 +727,20 @@ Get testnet credentials at: https://testnet.binancefuture.com
         "--api-secret",
         help="Binance API secret (or set BINANCE_API_SECRET env var)"
     )
-    
-    args = parser.parse_args()
-    
+
+    return parser
+
+
+def main():
+    """Main entry point."""
+    args = _build_parser().parse_args()
+
     cli = TradingCLI()
-    cli.run(api_key=args.api_key, api_secret=args.api_secret)
+    try:
+        asyncio.run(cli.run(api_key=args.api_key, api_secret=args.api_secret))
+    except KeyboardInterrupt:
+        # SIGINT cancels the main task and surfaces here, not inside run
+        print("\n\n👋 Interrupted. Goodbye!")
 
 
 if __name__ == "__main__":
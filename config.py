@@ -1,12 +1,16 @@
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Final
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BotConfig:
-    """Configuration class for the trading bot."""
+    """Configuration class for the trading bot.
+
+    Frozen and slotted: instances are immutable, hashable and carry no
+    per-instance __dict__.
+    """
     
     # API Credentials - Set these via environment variables or directly
     api_key: str = ""
@@ -27,11 +31,14 @@ class BotConfig:
     @classmethod
     def from_env(cls) -> "BotConfig":
         """Create configuration from environment variables."""
+        # One lookup of the environ mapping instead of a getenv call
+        # (and its attendant lookups) per variable
+        env = os.environ
         return cls(
-            api_key=os.getenv("BINANCE_API_KEY", ""),
-            api_secret=os.getenv("BINANCE_API_SECRET", ""),
-            testnet=os.getenv("BINANCE_TESTNET", "true").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            api_key=env.get("BINANCE_API_KEY", ""),
+            api_secret=env.get("BINANCE_API_SECRET", ""),
+            testnet=env.get("BINANCE_TESTNET", "true").lower() == "true",
+            log_level=env.get("LOG_LEVEL", "INFO"),
         )
     
     def validate(self) -> bool:
@@ -42,4 +49,4 @@ class BotConfig:
 
 
 # Default configuration instance
-DEFAULT_CONFIG = BotConfig()
+DEFAULT_CONFIG: Final[BotConfig] = BotConfig()
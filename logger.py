@@ -3,12 +3,61 @@ Logging configuration for Binance Futures Trading Bot.
 Provides comprehensive logging for API requests, responses, and errors.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import threading
 from pathlib import Path
 from typing import Optional
 
+# One file pipeline (queue -> memory buffer -> rotating file) per log
+# file, shared by every BotLogger. Independent RotatingFileHandlers on
+# the same path would fight over rollovers and lose records.
+_FILE_PIPELINES = {}
+_PIPELINE_LOCK = threading.Lock()
+
+
+def _file_queue(log_file: str, formatter: logging.Formatter) -> queue.SimpleQueue:
+    """Get (or build) the shared write pipeline for a log file."""
+    key = str(Path(log_file).resolve())
+    with _PIPELINE_LOCK:
+        pipeline = _FILE_PIPELINES.get(key)
+        if pipeline is None:
+            file_handler = logging.handlers.RotatingFileHandler(
+                key,
+                maxBytes=10 * 1024 * 1024,
+                backupCount=5,
+                encoding="utf-8",
+            )
+            file_handler.setFormatter(formatter)
+            memory_handler = logging.handlers.MemoryHandler(
+                capacity=100,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+            )
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                log_queue, memory_handler, respect_handler_level=True
+            )
+            listener.start()
+            pipeline = (log_queue, listener, memory_handler)
+            _FILE_PIPELINES[key] = pipeline
+            atexit.register(_close_pipeline, key)
+        return pipeline[0]
+
+
+def _close_pipeline(key: str):
+    """Stop a file pipeline, flushing queued and buffered records."""
+    with _PIPELINE_LOCK:
+        pipeline = _FILE_PIPELINES.pop(key, None)
+    if pipeline is not None:
+        _, listener, memory_handler = pipeline
+        listener.stop()
+        memory_handler.close()  # flushes remaining records
+
 
 class BotLogger:
     """Custom logger for the trading bot with API request/response logging."""
@@ -36,13 +85,23 @@ class BotLogger:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
         
-        # File handler
+        # File handler - records go through the shared per-file pipeline:
+        # enqueued here, drained on a listener thread, batched by a
+        # MemoryHandler (errors and worse flush straight through) into
+        # one RotatingFileHandler per file regardless of logger count.
+        self._log_file_key: Optional[str] = None
         if log_file:
-            log_path = Path(log_file)
-            file_handler = logging.FileHandler(log_path, encoding="utf-8")
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-    
+            self._log_file_key = str(Path(log_file).resolve())
+            self.logger.addHandler(
+                logging.handlers.QueueHandler(_file_queue(log_file, formatter))
+            )
+
+    def close(self):
+        """Stop this logger's file pipeline, flushing pending records."""
+        if self._log_file_key is not None:
+            _close_pipeline(self._log_file_key)
+            self._log_file_key = None
+
     def info(self, message: str):
         """Log info message."""
         self.logger.info(message)
@@ -62,35 +121,54 @@ class BotLogger:
     def critical(self, message: str):
         """Log critical message."""
         self.logger.critical(message)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether the underlying logger would emit at this level."""
+        return self.logger.isEnabledFor(level)
     
     def log_api_request(self, method: str, endpoint: str, params: Optional[dict] = None):
         """Log API request details."""
-        params_str = str(params) if params else "None"
-        self.info(f"API REQUEST  | {method} {endpoint} | Params: {params_str}")
-    
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("API REQUEST  | %s %s | Params: %s", method, endpoint, params or "None")
+
     def log_api_response(self, status: str, response: dict):
         """Log API response details."""
-        self.info(f"API RESPONSE | Status: {status} | Response: {response}")
-    
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("API RESPONSE | Status: %s | Response: %s", status, response)
+
     def log_api_error(self, error_code: str, error_message: str):
         """Log API error details."""
-        self.error(f"API ERROR    | Code: {error_code} | Message: {error_message}")
-    
+        self.logger.error("API ERROR    | Code: %s | Message: %s", error_code, error_message)
+
     def log_order(self, order_type: str, side: str, symbol: str, quantity: float, price: Optional[float] = None):
         """Log order placement details."""
-        price_str = f"@ {price}" if price else "@ MARKET"
-        self.info(f"ORDER        | {order_type} {side} {quantity} {symbol} {price_str}")
-    
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(
+            "ORDER        | %s %s %s %s @ %s", order_type, side, quantity, symbol, price or "MARKET"
+        )
+
     def log_order_result(self, order_id: str, status: str, filled_qty: float, avg_price: float):
         """Log order execution result."""
-        self.info(f"ORDER RESULT | ID: {order_id} | Status: {status} | Filled: {filled_qty} @ {avg_price}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(
+            "ORDER RESULT | ID: %s | Status: %s | Filled: %s @ %s", order_id, status, filled_qty, avg_price
+        )
 
 
 # Create default logger instance
+@functools.lru_cache(maxsize=None)
 def get_logger(
     name: str = "TradingBot",
     log_level: str = "INFO",
     log_file: str = "trading_bot.log"
 ) -> BotLogger:
-    """Get or create a logger instance."""
+    """Get or create a logger instance.
+
+    Calls with the same name/level/file return the same BotLogger, so
+    handlers and listener threads are set up only once per configuration.
+    """
     return BotLogger(name=name, log_level=log_level, log_file=log_file)